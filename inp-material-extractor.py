@@ -8,13 +8,341 @@ Author: Aref Aasi
 
 """
 
+import os
 import re
 import json
 import csv
-from typing import Dict, List, Any
+import pickle
+import warnings
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import (Callable, Dict, FrozenSet, Iterable, Iterator, List, Any,
+                    Optional, Tuple, Union)
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; data rows are then parsed in pure Python
+    np = None
 
-def extract_material_properties(inp_file_path: str) -> Dict[str, Dict[str, Any]]:
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json encoder is used instead
+    orjson = None
+
+
+def _to_str(raw: bytes) -> str:
+    """Decode raw bytes from the input file, ignoring invalid characters."""
+    return raw.decode('utf-8', 'ignore')
+
+
+# Keyword option patterns, compiled once at import time. Lines are parsed
+# as raw bytes; keyword lines are decoded before these are applied so that
+# \s also matches Unicode whitespace.
+_NAME_RE = re.compile(r'name\s*=\s*([^\s,]+)', re.IGNORECASE)
+_TYPE_RE = re.compile(r'type\s*=\s*([^\s,]+)', re.IGNORECASE)
+_HARD_RE = re.compile(r'hardening\s*=\s*([^\s,]+)', re.IGNORECASE)
+_CONST_RE = re.compile(r'constants\s*=\s*(\d+)', re.IGNORECASE)
+_DIGITS_RE = re.compile(r'(\d+)')
+
+# Hyperelastic models, one group per model so the match maps to its name
+_HYPER_MODEL_RE = re.compile(
+    r'(mooney[- ]*rivlin)|(neo[- ]*hooke)|(ogden)|(polynomial)|(yeoh)', re.IGNORECASE)
+_HYPER_MODEL_NAMES = (None, 'Mooney-Rivlin', 'Neo Hooke', 'Ogden', 'Polynomial', 'Yeoh')
+
+# Material property keywords, keyed by the upper-case keyword name. Each
+# entry maps to (property name, option regex, option key, option converter).
+_KEYWORD_DISPATCH = {
+    b'ELASTIC':       ('Elastic', _TYPE_RE, 'Elastic_Type', str),
+    b'PLASTIC':       ('Plastic', _HARD_RE, 'Plastic_Hardening', str),
+    b'DENSITY':       ('Density', None, None, None),
+    b'CONDUCTIVITY':  ('Conductivity', None, None, None),
+    b'SPECIFIC HEAT': ('Specific_Heat', None, None, None),
+    b'EXPANSION':     ('Expansion', _TYPE_RE, 'Expansion_Type', str),
+    b'DAMPING':       ('Damping', None, None, None),
+    b'HYPERELASTIC':  ('Hyperelastic', None, None, None),
+    b'VISCOELASTIC':  ('Viscoelastic', None, None, None),
+    b'USER MATERIAL': ('User_Material', _CONST_RE, 'User_Material_Constants', int),
+    b'DEPVAR':        (None, _DIGITS_RE, 'Depvar', int),
+}
+
+# Keyword prefixes that close the current material definition
+_NON_MATERIAL_PREFIXES = (
+    b'*STEP', b'*PART', b'*ASSEMBLY', b'*ELEMENT', b'*NODE',
+    b'*SECTION', b'*SOLID SECTION', b'*SHELL SECTION',
+    b'*BEAM SECTION', b'*BOUNDARY', b'*ELSET', b'*NSET',
+)
+
+# Lead byte of keyword lines
+_ASTERISK = ord('*')
+
+# Smallest data block worth handing to NumPy in one call
+_NUMPY_MIN_ROWS = 64
+
+# Largest file read into memory in one go; bigger decks are streamed. The
+# list of lines takes about twice the file size on top of the file itself.
+_SLURP_MAX_BYTES = 64 * 1024 * 1024
+
+# Read size used when streaming larger files
+_STREAM_CHUNK_BYTES = 1024 * 1024
+
+
+def _parse_data_rows(lines: List[bytes],
+                     dtype: str = 'float32') -> Union['np.ndarray', List[List[Any]]]:
+    """
+    Parse the comma-separated data lines of one property into a table.
+    
+    Large rectangular numeric blocks (e.g. long plasticity curves) are
+    converted by NumPy in a single call. Ragged or non-numeric blocks, and
+    all blocks when NumPy is not installed, are parsed line by line.
+    
+    Args:
+        lines (List[bytes]): Data lines with comments and whitespace stripped
+        dtype (str): NumPy float type of the returned array (default: float32);
+                     float64 is kept when values would overflow dtype
+        
+    Returns:
+        Union[np.ndarray, List[List[Any]]]: A 2-D float array with one row per
+            line when the block is rectangular and numeric and NumPy is
+            installed, otherwise one list of floats (or strings) per line.
+            Ragged tables are not converted to dtype; their values stay
+            Python (double precision) floats.
+    """
+    
+    if np is not None and len(lines) >= _NUMPY_MIN_ROWS:
+        ncols = lines[0].count(b',') + 1
+        
+        joined = b','.join(lines)
+        
+        # NumPy reads a blank field (e.g. '1.0, , 2.0' or a trailing ',') as
+        # -1.0, so such blocks go through the line parser, which drops them
+        packed = joined.translate(None, b' \t')
+        blank = b',,' in packed or packed.startswith(b',') or packed.endswith(b',')
+        
+        if not blank and all(line.count(b',') + 1 == ncols for line in lines):
+            try:
+                # Unparseable text only warns in NumPy, so escalate it
+                with warnings.catch_warnings():
+                    warnings.simplefilter('error', DeprecationWarning)
+                    arr = np.fromstring(joined, dtype=dtype, sep=',')
+            except (ValueError, DeprecationWarning):
+                arr = None
+            
+            if arr is not None and arr.size == len(lines) * ncols:
+                # Values beyond the range of dtype were read as inf
+                if not np.isfinite(arr).all():
+                    arr = _to_dtype(np.fromstring(joined, dtype=np.float64, sep=','), dtype)
+                return arr.reshape(-1, ncols)
+    
+    rows = []
+    for line in lines:
+        # float() ignores surrounding whitespace, so no strip is needed
+        fields = line.split(b',')
+        
+        try:
+            values = [float(v) for v in fields if v]
+        
+        except ValueError:
+            # Blank fields (e.g. a trailing ", "), text entries or Unicode
+            # whitespace such as NBSP, which only the str methods handle
+            values = [v.strip() for v in _to_str(line).split(',') if v.strip()]
+            try:
+                values = [float(v) for v in values]
+            except ValueError:
+                # If conversion fails, store as strings
+                pass
+        
+        if values:
+            rows.append(values)
+    
+    return _as_table(rows, dtype)
+
+
+def _as_table(rows: List[List[Any]], dtype: str) -> Union['np.ndarray', List[List[Any]]]:
+    """
+    Store rectangular numeric rows as one contiguous array rather than a
+    Python float object per value; other rows are returned unchanged.
+    """
+    
+    if np is not None and rows:
+        ncols = len(rows[0])
+        if all(len(row) == ncols and isinstance(row[0], float) for row in rows):
+            return _to_dtype(np.array(rows, dtype=np.float64), dtype)
+    
+    return rows
+
+
+def _to_dtype(arr: 'np.ndarray', dtype: str) -> 'np.ndarray':
+    """
+    Cast a float64 table to dtype, keeping float64 when a finite value would
+    overflow dtype (e.g. 1e39 in float32) rather than turning it into inf.
+    """
+    
+    with np.errstate(over='ignore'):
+        narrowed = arr.astype(dtype)
+    
+    if not np.isfinite(narrowed).all() and (
+            np.count_nonzero(np.isfinite(arr)) > np.count_nonzero(np.isfinite(narrowed))):
+        return arr
+    
+    return narrowed
+
+
+def _join_tables(existing: Union['np.ndarray', List[List[Any]]],
+                 table: Union['np.ndarray', List[List[Any]]],
+                 dtype: str) -> Union['np.ndarray', List[List[Any]]]:
+    """
+    Append a parsed data block to the rows already stored for a property.
+    
+    This happens when a block continues after a keyword that does not end
+    the property, e.g. a *MATERIAL line without a name.
+    """
+    
+    if not len(existing):
+        return table
+    
+    if (np is not None and isinstance(existing, np.ndarray)
+            and isinstance(table, np.ndarray) and existing.shape[1] == table.shape[1]):
+        return np.concatenate((existing, table))
+    
+    return _as_table(_table_rows(existing) + _table_rows(table), dtype)
+
+
+def _keyword_tuple(keywords: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Copy a keyword filter into a tuple.
+    
+    Raises:
+        TypeError: If the filter is a single string, which would otherwise
+                   be taken apart into one keyword per character
+    """
+    
+    if isinstance(keywords, (str, bytes)):
+        raise TypeError(f"keywords must be a list of keyword names, not a string; "
+                        f"use [{keywords!r}] instead of {keywords!r}")
+    
+    return tuple(keywords)
+
+
+def _keyword_keys(keywords: Iterable[str]) -> FrozenSet[bytes]:
+    """Normalize keyword names like '*Elastic' or 'User_Material' to dispatch keys."""
+    return frozenset(kw.strip().lstrip('*').replace('_', ' ').upper().encode()
+                     for kw in _keyword_tuple(keywords))
+
+
+@lru_cache(maxsize=None)
+def _dispatch_for(keywords: FrozenSet[bytes]) -> Dict[bytes, tuple]:
+    """
+    Return the part of _KEYWORD_DISPATCH covering the given keywords.
+    
+    The table is built once per keyword set and reused for every later deck
+    parsed with the same keyword filter.
+    
+    Raises:
+        ValueError: If a keyword is not a supported material keyword
+    """
+    
+    unknown = keywords - _KEYWORD_DISPATCH.keys()
+    if unknown:
+        names = ', '.join(sorted(_to_str(kw) for kw in unknown))
+        raise ValueError(f"Unsupported material keyword(s): {names}")
+    
+    return {kw: config for kw, config in _KEYWORD_DISPATCH.items() if kw in keywords}
+
+
+def _is_table(value: Any) -> bool:
+    """Check whether a property value is a data table (row list or NumPy array)."""
+    return isinstance(value, list) or (np is not None and isinstance(value, np.ndarray))
+
+
+def _table_rows(table: Union['np.ndarray', List[List[Any]]]) -> List[List[Any]]:
+    """Return the rows of a data table as lists of Python values."""
+    if isinstance(table, list):
+        return table
+    if table.dtype != np.float64:
+        # Go through the shortest decimal form so float32 values come out
+        # as written (0.3) rather than widened (0.30000001192092896)
+        return table.astype(str).astype(np.float64).tolist()
+    return table.tolist()
+
+
+def _text_rows(table: Union['np.ndarray', List[List[Any]]]) -> List[List[Any]]:
+    """
+    Return the rows of a data table for text output (CSV cells, console).
+    
+    Array values are formatted once as their shortest decimal strings (0.3
+    for float32 too) and kept as text; row lists are returned unchanged.
+    """
+    if isinstance(table, list):
+        return table
+    return table.astype(str).tolist()
+
+
+def _row_text(values: Any, is_text: bool) -> str:
+    """Format one table row like a Python list, e.g. '[210000.0, 0.3]'."""
+    if is_text:
+        return f"[{', '.join(values)}]"
+    return str(values)
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert NumPy arrays for the stdlib json encoder."""
+    if np is not None and isinstance(obj, np.ndarray):
+        return _table_rows(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stream_lines(inp_file_path: str) -> Iterator[bytes]:
+    """
+    Yield the raw lines of a file chunk by chunk.
+    
+    Chunks are split with bytes.splitlines() so that, like the in-memory
+    path, \\n, \\r\\n and bare \\r (classic Mac) all end a line.
+    """
+    
+    tail = b''  # Unterminated last line of the previous chunk
+    with open(inp_file_path, 'rb') as f:
+        for chunk in iter(partial(f.read, _STREAM_CHUNK_BYTES), b''):
+            block = tail + chunk
+            lines = block.splitlines()
+            
+            # A \r\n split across chunks only adds a blank line, which the
+            # parser skips
+            tail = b'' if block[-1:] in (b'\n', b'\r') else lines.pop()
+            yield from lines
+    
+    if tail:
+        yield tail
+
+
+def _iter_lines(inp_file_path: str) -> Iterator[bytes]:
+    """
+    Iterate over the raw lines of an input file.
+    
+    Files up to _SLURP_MAX_BYTES are read with a single read() call and split
+    by bytes.splitlines() in C, which avoids per-line read overhead. Larger
+    files are streamed in chunks so memory use stays bounded.
+    
+    Args:
+        inp_file_path (str): Path to the Abaqus .inp file
+        
+    Returns:
+        Iterator[bytes]: The lines of the file, with or without terminators
+    """
+    
+    if os.path.getsize(inp_file_path) <= _SLURP_MAX_BYTES:
+        with open(inp_file_path, 'rb') as f:
+            return iter(f.read().splitlines())
+    
+    return _stream_lines(inp_file_path)
+
+
+def extract_material_properties(inp_file_path: str,
+                                verbose: bool = False,
+                                dtype: str = 'float32',
+                                keywords: Optional[Iterable[str]] = None
+                                ) -> Dict[str, Dict[str, Any]]:
     """
     Extract material properties from an Abaqus .inp file.
     
@@ -23,6 +351,17 @@ def extract_material_properties(inp_file_path: str) -> Dict[str, Dict[str, Any]]
     
     Args:
         inp_file_path (str): Path to the Abaqus .inp file
+        verbose (bool): Print each material and data row as it is parsed
+                        (default: False, printing slows down large decks)
+        dtype (str): NumPy float type of property tables (default: float32,
+                     enough for engineering input; use 'float64' for full
+                     precision, e.g. UMAT constants near underflow). Tables
+                     with values beyond the range of dtype stay float64;
+                     ragged tables are lists of Python floats instead
+        keywords (Optional[Iterable[str]]): Filter of material keywords to
+                     extract, e.g. ['Elastic', 'Plastic']. Other material
+                     keywords are left out of the result: their data is
+                     skipped without being parsed (default: None, all)
         
     Returns:
         Dict[str, Dict[str, Any]]: Nested dictionary with structure:
@@ -34,29 +373,36 @@ def extract_material_properties(inp_file_path: str) -> Dict[str, Dict[str, Any]]
                 },
                 ...
             }
+            With NumPy installed, rectangular numeric property tables are
+            2-D arrays of shape (rows, values) and type dtype; ragged
+            tables (e.g. UMAT constants split over several lines) and text
+            entries stay lists of lists.
     
     Example:
         >>> materials = extract_material_properties('model.inp')
         >>> steel_elastic = materials['Steel']['Elastic']
-        >>> print(steel_elastic)  # [[210000.0, 0.3]]
+        >>> print(steel_elastic)  # [[2.1e+05 3.0e-01]]
     """
     
     # Initialize storage for all materials
     materials = {}
     
+    # Restrict keyword handling to the requested keywords, if any
+    if keywords is None:
+        dispatch = _KEYWORD_DISPATCH
+    else:
+        dispatch = _dispatch_for(_keyword_keys(keywords))
+    
     # Track current parsing state
     current_material = None      # Name of material being processed
     current_property = None      # Property type being read (e.g., 'Elastic')
+    current_list = None          # Data table of the current property
     reading_data = False         # Flag to indicate if we're reading property values
-    
-    # Read the entire input file with error handling for encoding issues
-    with open(inp_file_path, 'r', encoding='utf-8', errors='ignore') as f:
-        lines = f.readlines()
+    data_lines = []              # Buffered data lines of the current property
     
     # Process file line by line
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
+    for raw in _iter_lines(inp_file_path):
+        line = raw.strip()
         
         # =====================================================================
         # STEP 1: Handle empty lines and comments
@@ -64,199 +410,238 @@ def extract_material_properties(inp_file_path: str) -> Dict[str, Dict[str, Any]]
         
         # Skip completely empty lines
         if not line:
-            i += 1
             continue
         
-        # Skip comment-only lines (lines starting with **)
-        if line.startswith('**'):
-            i += 1
+        # bytes.strip() keeps Unicode whitespace (e.g. a leading or
+        # trailing NBSP)
+        if line[0] > 0x7F or line[-1] > 0x7F:
+            line = _to_str(line).strip().encode('utf-8')
+            if not line:
+                continue
+        
+        # One scan finds both comment-only lines (starting with **) and
+        # inline comments
+        comment = line.find(b'**')
+        if comment == 0:
             continue
-            
+        
         # Remove inline comments from data lines
-        if '**' in line:
-            line = line.split('**')[0].strip()
+        if comment > 0:
+            line = line[:comment].rstrip()
             if not line:  # If nothing left after removing comment
-                i += 1
                 continue
         
         # =====================================================================
-        # STEP 2: Detect material definition
+        # STEP 2: Collect property data values
+        # =====================================================================
+        
+        # Lines are classified by their first character, so data lines
+        # (the bulk of a deck: nodes, elements, ...) skip all keyword work
+        if line[0] != _ASTERISK:
+            # Values are parsed in one go when the block ends
+            if reading_data:
+                data_lines.append(line)
+            continue
+        
+        # A keyword line ends the data block of the current property
+        if data_lines:
+            table = _parse_data_rows(data_lines, dtype)
+            current_list = _join_tables(current_list, table, dtype)
+            materials[current_material][current_property] = current_list
+            if verbose:
+                is_text = not isinstance(table, list)
+                for row in _text_rows(table):
+                    print(f"  {current_property}: {_row_text(row, is_text)}")
+            data_lines = []
+        
+        line_upper = line.upper()
+        
+        # =====================================================================
+        # STEP 3: Detect material definition
         # =====================================================================
         
-        if line.upper().startswith('*MATERIAL'):
+        if line_upper.startswith(b'*MATERIAL'):
             # Extract material name using regex (case insensitive)
-            match = re.search(r'name\s*=\s*([^\s,]+)', line, re.IGNORECASE)
+            match = _NAME_RE.search(_to_str(line))
             
             if match:
                 current_material = match.group(1)
                 materials[current_material] = {}  # Initialize new material
                 current_property = None
+                current_list = None
                 reading_data = False
-                print(f"Found material: {current_material}")
+                if verbose:
+                    print(f"Found material: {current_material}")
         
         # =====================================================================
-        # STEP 3: Detect and process material property keywords
+        # STEP 4: Detect and process material property keywords
         # =====================================================================
         
-        elif current_material and line.startswith('*'):
+        elif current_material:
             reading_data = False  # Reset data reading flag
-            line_upper = line.upper()
             
-            # -----------------------------------------------------------------
-            # Elastic Properties
-            # -----------------------------------------------------------------
-            if line_upper.startswith('*ELASTIC'):
-                current_property = 'Elastic'
-                materials[current_material][current_property] = []
-                reading_data = True
-                
-                # Check for elastic type (e.g., ISOTROPIC, ORTHOTROPIC)
-                type_match = re.search(r'type\s*=\s*([^\s,]+)', line, re.IGNORECASE)
-                if type_match:
-                    materials[current_material]['Elastic_Type'] = type_match.group(1)
+            # Keyword name without the leading '*' and its options
+            keyword = line_upper[1:].split(b',', 1)[0].strip()
+            if keyword and keyword[-1] > 0x7F:  # e.g. '*Elastic\xa0, type=...'
+                keyword = _to_str(keyword).strip().encode('utf-8')
+            config = dispatch.get(keyword)
             
-            # -----------------------------------------------------------------
-            # Plastic Properties
-            # -----------------------------------------------------------------
-            elif line_upper.startswith('*PLASTIC'):
-                current_property = 'Plastic'
-                materials[current_material][current_property] = []
-                reading_data = True
+            # -------------------------------------------------------------
+            # Material property keywords
+            # -------------------------------------------------------------
+            if config:
+                prop_name, attr_re, attr_key, attr_type = config
                 
-                # Check for hardening type (e.g., ISOTROPIC, KINEMATIC)
-                hard_match = re.search(r'hardening\s*=\s*([^\s,]+)', line, re.IGNORECASE)
-                if hard_match:
-                    materials[current_material]['Plastic_Hardening'] = hard_match.group(1)
-            
-            # -----------------------------------------------------------------
-            # Density
-            # -----------------------------------------------------------------
-            elif line_upper.startswith('*DENSITY'):
-                current_property = 'Density'
-                materials[current_material][current_property] = []
-                reading_data = True
-            
-            # -----------------------------------------------------------------
-            # Thermal Conductivity
-            # -----------------------------------------------------------------
-            elif line_upper.startswith('*CONDUCTIVITY'):
-                current_property = 'Conductivity'
-                materials[current_material][current_property] = []
-                reading_data = True
-            
-            # -----------------------------------------------------------------
-            # Specific Heat
-            # -----------------------------------------------------------------
-            elif line_upper.startswith('*SPECIFIC HEAT'):
-                current_property = 'Specific_Heat'
-                materials[current_material][current_property] = []
-                reading_data = True
-            
-            # -----------------------------------------------------------------
-            # Thermal Expansion
-            # -----------------------------------------------------------------
-            elif line_upper.startswith('*EXPANSION'):
-                current_property = 'Expansion'
-                materials[current_material][current_property] = []
-                reading_data = True
+                # DEPVAR only carries an option, not a data block
+                if prop_name:
+                    current_property = prop_name
+                    current_list = materials[current_material][current_property] = []
+                    reading_data = True
                 
-                # Check for expansion type (e.g., ISO, ORTHO)
-                type_match = re.search(r'type\s*=\s*([^\s,]+)', line, re.IGNORECASE)
-                if type_match:
-                    materials[current_material]['Expansion_Type'] = type_match.group(1)
-            
-            # -----------------------------------------------------------------
-            # Damping
-            # -----------------------------------------------------------------
-            elif line_upper.startswith('*DAMPING'):
-                current_property = 'Damping'
-                materials[current_material][current_property] = []
-                reading_data = True
-            
-            # -----------------------------------------------------------------
-            # Hyperelastic Materials
-            # -----------------------------------------------------------------
-            elif line_upper.startswith('*HYPERELASTIC'):
-                current_property = 'Hyperelastic'
-                materials[current_material][current_property] = []
-                reading_data = True
+                # Extract the keyword option (e.g. type=, hardening=)
+                if attr_re:
+                    attr_match = attr_re.search(_to_str(line))
+                    if attr_match:
+                        materials[current_material][attr_key] = attr_type(attr_match.group(1))
                 
                 # Detect hyperelastic model type
-                models = ['mooney-rivlin', 'neo hooke', 'ogden', 'polynomial', 'yeoh']
-                for model in models:
-                    if model.replace(' ', '') in line.lower().replace(' ', ''):
-                        materials[current_material]['Hyperelastic_Model'] = model.title()
-                        break
-            
-            # -----------------------------------------------------------------
-            # Viscoelastic Materials
-            # -----------------------------------------------------------------
-            elif line_upper.startswith('*VISCOELASTIC'):
-                current_property = 'Viscoelastic'
-                materials[current_material][current_property] = []
-                reading_data = True
-            
-            # -----------------------------------------------------------------
-            # User-Defined Materials (UMAT)
-            # -----------------------------------------------------------------
-            elif line_upper.startswith('*USER MATERIAL'):
-                current_property = 'User_Material'
-                materials[current_material][current_property] = []
-                reading_data = True
-                
-                # Extract number of constants
-                const_match = re.search(r'constants\s*=\s*(\d+)', line, re.IGNORECASE)
-                if const_match:
-                    materials[current_material]['User_Material_Constants'] = int(const_match.group(1))
-            
-            # -----------------------------------------------------------------
-            # Dependent Variables (DEPVAR)
-            # -----------------------------------------------------------------
-            elif line_upper.startswith('*DEPVAR'):
-                const_match = re.search(r'(\d+)', line)
-                if const_match:
-                    materials[current_material]['Depvar'] = int(const_match.group(1))
-                reading_data = False
+                if keyword == b'HYPERELASTIC':
+                    model_match = _HYPER_MODEL_RE.search(_to_str(line))
+                    if model_match:
+                        model = _HYPER_MODEL_NAMES[model_match.lastindex]
+                        materials[current_material]['Hyperelastic_Model'] = model
             
-            # -----------------------------------------------------------------
+            # -------------------------------------------------------------
             # Other Keywords (may indicate end of material section)
-            # -----------------------------------------------------------------
+            # -------------------------------------------------------------
             else:
                 reading_data = False
                 
                 # Check if we're leaving the material definition section
-                non_material_keywords = [
-                    '*STEP', '*PART', '*ASSEMBLY', '*ELEMENT', '*NODE',
-                    '*SECTION', '*SOLID SECTION', '*SHELL SECTION', 
-                    '*BEAM SECTION', '*BOUNDARY', '*ELSET', '*NSET'
-                ]
-                
-                if any(line_upper.startswith(kw) for kw in non_material_keywords):
+                if line_upper.startswith(_NON_MATERIAL_PREFIXES):
                     current_material = None
                     current_property = None
+                    current_list = None
+    
+    # Flush the data block still open at the end of the file
+    if data_lines:
+        table = _parse_data_rows(data_lines, dtype)
+        current_list = _join_tables(current_list, table, dtype)
+        materials[current_material][current_property] = current_list
+        if verbose:
+            is_text = not isinstance(table, list)
+            for row in _text_rows(table):
+                print(f"  {current_property}: {_row_text(row, is_text)}")
+    
+    return materials
+
+
+def build_parser(known_keywords: Iterable[str]
+                 ) -> Callable[..., Dict[str, Dict[str, Any]]]:
+    """
+    Build a parser that extracts only a fixed set of material keywords.
+    
+    Pipelines that parse many similar decks can build the parser once; its
+    keyword table is validated and cached on the first call and reused for
+    every deck afterwards. This is a filter: material keywords not listed
+    are dropped from the result, and skipping their data is where the
+    speedup comes from.
+    
+    Args:
+        known_keywords (Iterable[str]): Material keywords to extract, e.g.
+                                        ['Elastic', 'Plastic', 'Specific_Heat']
         
-        # =====================================================================
-        # STEP 4: Read property data values
-        # =====================================================================
-        
-        elif current_material and reading_data and current_property and not line.startswith('*'):
-            # Parse comma-separated values from data line
-            values = [v.strip() for v in line.split(',') if v.strip()]
-            
-            if values:
-                try:
-                    # Attempt to convert all values to floats
-                    numeric_values = [float(v) for v in values]
-                    materials[current_material][current_property].append(numeric_values)
-                    print(f"  {current_property}: {numeric_values}")
-                    
-                except ValueError:
-                    # If conversion fails, store as strings
-                    materials[current_material][current_property].append(values)
-                    print(f"  {current_property}: {values}")
+    Returns:
+        Callable[..., Dict[str, Dict[str, Any]]]: extract_material_properties
+            with the keywords filter bound; it takes the same other arguments
+    
+    Raises:
+        TypeError: If known_keywords is a single string instead of a list
+        ValueError: If a keyword is not a supported material keyword
+    
+    Example:
+        >>> parse = build_parser(['Elastic', 'Density'])
+        >>> materials = parse('model.inp')
+    """
+    
+    keywords = _keyword_tuple(known_keywords)
+    
+    # Fail early on unsupported keywords instead of on the first deck
+    _dispatch_for(_keyword_keys(keywords))
+    
+    return partial(extract_material_properties, keywords=keywords)
+
+
+def extract_many(inp_file_paths: List[str], workers: Optional[int] = None,
+                 verbose: bool = False,
+                 dtype: str = 'float32',
+                 keywords: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Extract material properties from several Abaqus .inp files in parallel.
+    
+    Each file is parsed by extract_material_properties in its own worker
+    process, so independent decks use all available CPU cores.
+    
+    Worker processes import this module by name, which needs it in
+    sys.modules: run the script directly, or register it there when
+    loading it with importlib. Otherwise a warning is issued and the
+    files are parsed one after another in this process.
+    
+    Args:
+        inp_file_paths (List[str]): Paths to the Abaqus .inp files
+        workers (Optional[int]): Number of worker processes
+                                 (default: None, one per CPU core)
+        verbose (bool): Print each material and data row as it is parsed
+        dtype (str): NumPy float type of property tables (default: float32)
+        keywords (Optional[Iterable[str]]): Material keywords to extract;
+                                            others are dropped (default: None, all)
         
-        # Move to next line
-        i += 1
+    Returns:
+        Dict[str, Dict[str, Any]]: Materials of all files, keyed by
+            'FileStem::MaterialName' so same-named materials do not collide.
+            Files sharing a name use their path without suffix instead,
+            e.g. 'a/model::Steel' and 'b/model::Steel'.
+    
+    Raises:
+        ValueError: If the same file is listed more than once
+    
+    Example:
+        >>> materials = extract_many(['bracket.inp', 'housing.inp'])
+        >>> steel_elastic = materials['bracket::Steel']['Elastic']
+    """
+    
+    # Namespace materials by file stem, or by the path without suffix when
+    # several decks share a file name (e.g. a/model.inp and b/model.inp)
+    stems = [Path(path).stem for path in inp_file_paths]
+    stem_counts = Counter(stems)
+    prefixes = [stem if stem_counts[stem] == 1 else Path(path).with_suffix('').as_posix()
+                for stem, path in zip(stems, inp_file_paths)]
+    
+    duplicates = sorted(p for p, n in Counter(prefixes).items() if n > 1)
+    if duplicates:
+        raise ValueError(f"Input file(s) listed more than once: {', '.join(duplicates)}")
+    
+    materials = {}
+    extract = partial(extract_material_properties, verbose=verbose, dtype=dtype,
+                      keywords=None if keywords is None else _keyword_tuple(keywords))
+    
+    # Workers receive the parser by reference, which fails when the module
+    # was loaded from its file path without being registered
+    try:
+        pickle.dumps(extract)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        warnings.warn("extract_many: module is not importable by worker "
+                      "processes, parsing the files sequentially", RuntimeWarning,
+                      stacklevel=2)
+        results = map(extract, inp_file_paths)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(extract, inp_file_paths))
+    
+    # Results come back in input order
+    for prefix, file_materials in zip(prefixes, results):
+        for mat_name, properties in file_materials.items():
+            materials[f"{prefix}::{mat_name}"] = properties
     
     return materials
 
@@ -267,7 +652,8 @@ def save_to_json(materials: Dict[str, Dict[str, Any]],
     Save extracted material properties to a JSON file.
     
     The JSON format preserves the complete hierarchical structure of materials
-    and their properties, making it ideal for programmatic access.
+    and their properties, making it ideal for programmatic access. The file is
+    encoded with orjson when it is installed, otherwise with the json module.
     
     Args:
         materials (Dict[str, Dict[str, Any]]): Material properties dictionary
@@ -283,14 +669,69 @@ def save_to_json(materials: Dict[str, Dict[str, Any]],
         }
     """
     
-    with open(output_file, 'w') as f:
-        json.dump(materials, f, indent=4)
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(materials,
+                                 option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        # Same 2-space layout as orjson.OPT_INDENT_2
+        with open(output_file, 'w') as f:
+            json.dump(materials, f, indent=2, default=_json_default)
     
     print(f"\n✓ Material properties saved to: {output_file}")
 
 
+def _iter_csv_rows(materials: Dict[str, Dict[str, Any]],
+                   max_values: int,
+                   include_values_column: bool) -> Iterator[List[Any]]:
+    """
+    Yield the flattened CSV rows of the material properties one at a time.
+    
+    Each row is ordered like the CSV columns (Material, Property, Row_Index,
+    [Values,] Value_1, ...) and padded with empty cells to max_values values.
+    
+    Args:
+        materials (Dict[str, Dict[str, Any]]): Material properties dictionary
+        max_values (int): Number of Value_N columns in the CSV file
+        include_values_column (bool): Emit the Values column
+        
+    Yields:
+        List[Any]: One CSV row
+    """
+    
+    for mat_name, properties in materials.items():
+        for prop_name, prop_value in properties.items():
+            
+            # Handle data tables (most common case)
+            if _is_table(prop_value):
+                # Array cells are written as preformatted text
+                is_text = not isinstance(prop_value, list)
+                for idx, values in enumerate(_text_rows(prop_value)):
+                    row = [mat_name, prop_name, idx]
+                    if include_values_column:
+                        row.append(_row_text(values, is_text))
+                    
+                    # Add individual value columns for numeric data
+                    if isinstance(values, list):
+                        row.extend(values)
+                        row.extend([''] * (max_values - len(values)))
+                    else:
+                        row.extend([''] * max_values)
+                    
+                    yield row
+            
+            # Handle single value properties (like material types)
+            elif include_values_column:
+                yield [mat_name, prop_name, 0, str(prop_value)] + [''] * max_values
+            
+            # Without the Values column the value itself goes into Value_1
+            else:
+                yield [mat_name, prop_name, 0, prop_value] + [''] * (max_values - 1)
+
+
 def save_to_csv(materials: Dict[str, Dict[str, Any]], 
-                output_file: str = "material_properties.csv") -> None:
+                output_file: str = "material_properties.csv",
+                include_values_column: bool = False) -> None:
     """
     Save extracted material properties to a CSV file.
     
@@ -301,69 +742,53 @@ def save_to_csv(materials: Dict[str, Dict[str, Any]],
     Args:
         materials (Dict[str, Dict[str, Any]]): Material properties dictionary
         output_file (str): Path for output CSV file (default: material_properties.csv)
+        include_values_column (bool): Add the Values column, which repeats
+                                      every row as a string (default: False)
     
     CSV columns:
         - Material: Name of the material
         - Property: Type of property (e.g., Elastic, Plastic)
         - Row_Index: Index for multiple data rows of same property
-        - Values: String representation of all values
-        - Value_1, Value_2, ...: Individual numeric values
+        - Values: String representation of all values (optional)
+        - Value_1, Value_2, ...: Individual numeric values; single value
+          properties (like material types) use Value_1 when there is no
+          Values column
     """
     
-    rows = []
-    
-    # Flatten the nested dictionary structure
-    for mat_name, properties in materials.items():
-        for prop_name, prop_value in properties.items():
-            
-            # Handle list properties (most common case)
-            if isinstance(prop_value, list):
-                for idx, values in enumerate(prop_value):
-                    row = {
-                        'Material': mat_name,
-                        'Property': prop_name,
-                        'Row_Index': idx,
-                        'Values': str(values)
-                    }
-                    
-                    # Add individual value columns for numeric data
-                    if isinstance(values, list):
-                        for i, val in enumerate(values):
-                            row[f'Value_{i+1}'] = val
-                    
-                    rows.append(row)
-            
-            # Handle single value properties (like material types)
+    # First pass: count rows and find the number of Value_N columns needed
+    n_rows = 0
+    max_values = 0
+    for properties in materials.values():
+        for prop_value in properties.values():
+            if np is not None and isinstance(prop_value, np.ndarray):
+                n_rows += prop_value.shape[0]
+                max_values = max(max_values, prop_value.shape[1])
+            elif isinstance(prop_value, list):
+                n_rows += len(prop_value)
+                for values in prop_value:
+                    if isinstance(values, list) and len(values) > max_values:
+                        max_values = len(values)
             else:
-                row = {
-                    'Material': mat_name,
-                    'Property': prop_name,
-                    'Row_Index': 0,
-                    'Values': str(prop_value)
-                }
-                rows.append(row)
+                n_rows += 1
+                if not include_values_column and max_values < 1:
+                    max_values = 1
     
     # Write to CSV if we have data
-    if rows:
+    if n_rows:
         # Determine all column names needed
-        fieldnames = ['Material', 'Property', 'Row_Index', 'Values']
-        
-        # Find maximum number of value columns needed
-        max_values = 0
-        for row in rows:
-            value_cols = [k for k in row.keys() if k.startswith('Value_')]
-            if len(value_cols) > max_values:
-                max_values = len(value_cols)
+        fieldnames = ['Material', 'Property', 'Row_Index']
+        if include_values_column:
+            fieldnames.append('Values')
         
         # Add Value_N columns to fieldnames
         for i in range(1, max_values + 1):
             fieldnames.append(f'Value_{i}')
         
-        # Write CSV file
+        # Second pass: stream rows straight into the CSV file
         with open(output_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(_iter_csv_rows(materials, max_values, include_values_column))
         
         print(f"✓ Material properties saved to: {output_file}")
     else:
@@ -389,9 +814,10 @@ def print_material_properties(materials: Dict[str, Dict[str, Any]]) -> None:
             for prop_name, prop_value in properties.items():
                 print(f"\n{prop_name}:")
                 
-                if isinstance(prop_value, list):
-                    for i, values in enumerate(prop_value):
-                        print(f"  {values}")
+                if _is_table(prop_value):
+                    is_text = not isinstance(prop_value, list)
+                    for values in _text_rows(prop_value):
+                        print(f"  {_row_text(values, is_text)}")
                 else:
                     print(f"  {prop_value}")
 
@@ -413,6 +839,9 @@ if __name__ == "__main__":
     json_output = "material_properties.json"
     csv_output = "material_properties.csv"
     
+    # Print every material and data row while parsing
+    verbose = False
+    
     # -------------------------------------------------------------------------
     # Processing
     # -------------------------------------------------------------------------
@@ -424,7 +853,7 @@ if __name__ == "__main__":
         print(f"\nReading material properties from: {inp_file}\n")
         
         # Extract materials from .inp file
-        materials = extract_material_properties(inp_file)
+        materials = extract_material_properties(inp_file, verbose=verbose)
         
         if materials:
             # Print summary to console